@@ -2,6 +2,8 @@
 from ipywidgets import Widget
 from traitlets import HasTraits
 
+from ipytone import __version__
+
 extensions = [
     "sphinx.ext.autodoc",
     "sphinx.ext.autosummary",
@@ -34,6 +36,11 @@ project = "ipytone"
 copyright = "2022, Benoit Bovy"
 author = "Benoit Bovy"
 
+# The full version, including alpha/beta/rc tags.
+release = __version__
+# The short X.Y version.
+version = ".".join(release.split(".")[:2])
+
 # List of patterns, relative to source directory, that match files and
 # directories to ignore when looking for source files.
 # This patterns also effect to html_static_path and html_extra_path
@@ -83,9 +90,13 @@ htmlhelp_basename = "ipytonedoc"
 intersphinx_mapping = {"https://docs.python.org/": None}
 
 
+# ipywidgets.Widget (and traitlets.HasTraits) members, not shown in the API docs
+_WIDGET_MEMBERS = frozenset(Widget.__dict__) | frozenset(HasTraits.__dict__)
+
+
 def skip_widget_members(app, what, name, obj, skip, options):
     """Be succinct and skip showing all ipywidgets.Widget members."""
-    if name in Widget.__dict__ or name in HasTraits.__dict__:
+    if name in _WIDGET_MEMBERS:
         return True
 
     return None
@@ -93,3 +104,5 @@ def skip_widget_members(app, what, name, obj, skip, options):
 
 def setup(app):
     app.connect("autodoc-skip-member", skip_widget_members)
+
+    return {"parallel_read_safe": True, "parallel_write_safe": True}
@@ -3,93 +3,12 @@
 # Copyright (c) Benoit Bovy.
 # Distributed under the terms of the Modified BSD License.
 
+import importlib
+
 from ._version import __version__
-from .analysis import FFT, Analyser, DCMeter, Follower, Meter, Waveform
-from .base import PyAudioNode
-from .channel import (
-    Channel,
-    CrossFade,
-    Merge,
-    Mono,
-    MultibandSplit,
-    Panner,
-    Panner3D,
-    PanVol,
-    Solo,
-    Split,
-)
-from .core import (
-    AudioBuffer,
-    AudioBuffers,
-    Gain,
-    Param,
-    Volume,
-    destination,
-    get_destination,
-    get_listener,
-)
-from .dynamics import Compressor, Limiter, MultibandCompressor
-from .effect import (
-    Distortion,
-    FeedbackDelay,
-    FrequencyShifter,
-    PingPongDelay,
-    PitchShift,
-    Reverb,
-    Tremolo,
-    Vibrato,
-)
-from .envelope import AmplitudeEnvelope, Envelope, FrequencyEnvelope
-from .event import Event, Loop, Note, Part, Pattern, Sequence
-from .filter import (  # PhaseShiftAllpass,
-    EQ3,
-    BiquadFilter,
-    FeedbackCombFilter,
-    Filter,
-    LowpassCombFilter,
-    OnePoleFilter,
-)
-from .graph import get_audio_graph
-from .instrument import (
-    AMSynth,
-    DuoSynth,
-    FMSynth,
-    Instrument,
-    MembraneSynth,
-    Monophonic,
-    MonoSynth,
-    NoiseSynth,
-    PluckSynth,
-    PolySynth,
-    Sampler,
-    Synth,
-)
-from .signal import (
-    Abs,
-    Add,
-    AudioToGain,
-    GreaterThan,
-    Multiply,
-    Negate,
-    Pow,
-    Scale,
-    Signal,
-    Subtract,
-    WaveShaper,
-)
-from .source import (
-    LFO,
-    AMOscillator,
-    FatOscillator,
-    FMOscillator,
-    Noise,
-    OmniOscillator,
-    Oscillator,
-    Player,
-    Players,
-    PulseOscillator,
-    PWMOscillator,
-)
+
+# eagerly imported: the (deprecated) ``transport`` instance shadows the
+# ``ipytone.transport`` submodule name
 from .transport import (
     get_transport,
     schedule,
@@ -98,6 +17,134 @@ from .transport import (
     transport,
 )
 
+# public objects that are lazily imported from their submodule on first access
+_LAZY_SUBMODULES = {
+    "analysis": ["FFT", "Analyser", "DCMeter", "Follower", "Meter", "Waveform"],
+    "base": ["PyAudioNode"],
+    "channel": [
+        "Channel",
+        "CrossFade",
+        "Merge",
+        "Mono",
+        "MultibandSplit",
+        "Panner",
+        "Panner3D",
+        "PanVol",
+        "Solo",
+        "Split",
+    ],
+    "core": [
+        "AudioBuffer",
+        "AudioBuffers",
+        "Gain",
+        "Param",
+        "Volume",
+        "destination",
+        "get_destination",
+        "get_listener",
+    ],
+    "dynamics": ["Compressor", "Limiter", "MultibandCompressor"],
+    "effect": [
+        "Distortion",
+        "FeedbackDelay",
+        "FrequencyShifter",
+        "PingPongDelay",
+        "PitchShift",
+        "Reverb",
+        "Tremolo",
+        "Vibrato",
+    ],
+    "envelope": ["AmplitudeEnvelope", "Envelope", "FrequencyEnvelope"],
+    "event": ["Event", "Loop", "Note", "Part", "Pattern", "Sequence"],
+    "filter": [
+        # "PhaseShiftAllpass",
+        "EQ3",
+        "BiquadFilter",
+        "FeedbackCombFilter",
+        "Filter",
+        "LowpassCombFilter",
+        "OnePoleFilter",
+    ],
+    "graph": ["get_audio_graph"],
+    "instrument": [
+        "AMSynth",
+        "DuoSynth",
+        "FMSynth",
+        "Instrument",
+        "MembraneSynth",
+        "Monophonic",
+        "MonoSynth",
+        "NoiseSynth",
+        "PluckSynth",
+        "PolySynth",
+        "Sampler",
+        "Synth",
+    ],
+    "signal": [
+        "Abs",
+        "Add",
+        "AudioToGain",
+        "GreaterThan",
+        "Multiply",
+        "Negate",
+        "Pow",
+        "Scale",
+        "Signal",
+        "Subtract",
+        "WaveShaper",
+    ],
+    "source": [
+        "LFO",
+        "AMOscillator",
+        "FatOscillator",
+        "FMOscillator",
+        "Noise",
+        "OmniOscillator",
+        "Oscillator",
+        "Player",
+        "Players",
+        "PulseOscillator",
+        "PWMOscillator",
+    ],
+}
+
+_LAZY_ATTRS = {name: mod for mod, names in _LAZY_SUBMODULES.items() for name in names}
+
+# submodules that were bound to the package by eager imports (backwards compatibility)
+_SUBMODULE_NAMES = {*_LAZY_SUBMODULES, "callback", "observe", "serialization", "utils"}
+
+__all__ = sorted(
+    [
+        "__version__",
+        "get_transport",
+        "schedule",
+        "schedule_once",
+        "schedule_repeat",
+        "transport",
+        *_LAZY_ATTRS,
+    ]
+)
+
+
+def __getattr__(name):
+    if name in _SUBMODULE_NAMES:
+        return importlib.import_module(f".{name}", __name__)
+
+    try:
+        mod_name = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    mod = importlib.import_module(f".{mod_name}", __name__)
+    value = getattr(mod, name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS) | _SUBMODULE_NAMES)
+
 
 def _jupyter_labextension_paths():
     """Called by Jupyter Lab Server to detect if it is a valid labextension and
@@ -1,3 +1,5 @@
+from types import MappingProxyType
+
 import numpy as np
 from traitlets import Bool, Enum, Float, Int, List, Unicode, validate
 
@@ -13,6 +15,13 @@ def is_pow2(value):
     return (value & (value - 1) == 0) and value != 0
 
 
+def _validate_size(self, proposal):
+    size = proposal["value"]
+    if not is_pow2(size):
+        raise ValueError(f"size must be a power of two, found {size}")
+    return size
+
+
 class Analyser(AudioNode, ScheduleObserveMixin):
     """A node that may be used to extract frequency (FFT) or waveform data
     from an incoming audio signal.
@@ -35,12 +44,7 @@ class Analyser(AudioNode, ScheduleObserveMixin):
         kwargs.update({"_input": gain, "_output": gain, "_channels": channels})
         super().__init__(**kwargs)
 
-    @validate("size")
-    def _is_power_of_two(self, proposal):
-        size = proposal["value"]
-        if not is_pow2(size):
-            raise ValueError(f"size must be a power of two, found {size}")
-        return size
+    _is_power_of_two = validate("size")(_validate_size)
 
     @property
     def channels(self):
@@ -53,14 +57,22 @@ class BaseMeter(AudioNode, ScheduleObserveMixin):
 
     _model_name = Unicode("BaseMeterModel").tag(sync=True)
 
+    # options of the internal analyser node (shared by all instances, read-only)
+    _analyser_options = MappingProxyType({"size": 256, "type": "waveform"})
+    # names of the traits which values are also set for the internal analyser node
+    _analyser_traits = ()
+
     def __init__(self, **kwargs):
-        self._analyser = Analyser(_create_node=False, **self._get_analyser_options())
+        self._analyser = Analyser(_create_node=False, **self._get_analyser_options(kwargs))
 
         kwargs.update({"_input": self._analyser, "_output": self._analyser})
         super().__init__(**kwargs)
 
-    def _get_analyser_options(self):
-        return {"size": 256, "type": "waveform"}
+    def _get_analyser_options(self, kwargs):
+        trait_options = {
+            name: kwargs.get(name, self.trait_defaults(name)) for name in self._analyser_traits
+        }
+        return {**self._analyser_options, **trait_options}
 
 
 class Meter(BaseMeter):
@@ -75,13 +87,14 @@ class Meter(BaseMeter):
     )
     smoothing = Float(0.8, help="controls the time averaging window").tag(sync=True)
 
+    _analyser_traits = ("smoothing",)
+
     def __init__(self, channel_count=1, **kwargs):
         self._channels = channel_count
         super().__init__(**kwargs)
-        self._analyser.smoothing = self.smoothing
 
-    def _get_analyser_options(self):
-        return {"size": 256, "type": "waveform", "channels": self._channels}
+    def _get_analyser_options(self, kwargs):
+        return {**super()._get_analyser_options(kwargs), "channels": self._channels}
 
     @property
     def channels(self):
@@ -105,19 +118,10 @@ class Waveform(BaseMeter):
     _observable_traits = List(["array"])
     _default_observed_trait = "array"
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self._analyser.size = self.size
-
-    def _get_analyser_options(self):
-        return {"type": "waveform"}
+    _analyser_options = MappingProxyType({"type": "waveform"})
+    _analyser_traits = ("size",)
 
-    @validate("size")
-    def _is_power_of_two(self, proposal):
-        size = proposal["value"]
-        if not is_pow2(size):
-            raise ValueError(f"size must be a power of two, found {size}")
-        return size
+    _is_power_of_two = validate("size")(_validate_size)
 
 
 class FFT(BaseMeter):
@@ -134,27 +138,25 @@ class FFT(BaseMeter):
     _observable_traits = List(["array"])
     _default_observed_trait = "array"
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self._analyser.size = self.size
-        self._analyser.smoothing = self.smoothing
+    _analyser_options = MappingProxyType({"type": "fft"})
+    _analyser_traits = ("size", "smoothing")
 
-    def _get_analyser_options(self):
-        return {"type": "fft"}
+    _frequency_labels = None
 
-    @validate("size")
-    def _is_power_of_two(self, proposal):
-        size = proposal["value"]
-        if not is_pow2(size):
-            raise ValueError(f"size must be a power of two, found {size}")
-        return size
+    _is_power_of_two = validate("size")(_validate_size)
 
     @property
     def frequency_labels(self):
         """Frequency label values (in Hertz)."""
-        # assume sample rate 44.1 kHz (TODO: get it from Tone context)
-        sample_rate = 44100
-        return np.arange(self.size) * sample_rate / (self.size * 2)
+        # cached (read-only) array, only re-computed when size changes
+        labels = self._frequency_labels
+        if labels is None or labels.size != self.size:
+            # assume sample rate 44.1 kHz (TODO: get it from Tone context)
+            sample_rate = 44100
+            labels = np.linspace(0, sample_rate / 2, self.size, endpoint=False)
+            labels.flags.writeable = False
+            self._frequency_labels = labels
+        return labels
 
 
 class Follower(PyAudioNode):
@@ -179,5 +181,7 @@ class Follower(PyAudioNode):
 
     @smoothing.setter
     def smoothing(self, value):
+        if value == self._smoothing:
+            return
         self._smoothing = value
-        self._lowpass.frequency = 1 / self._smoothing
+        self._lowpass.frequency = 1 / value
@@ -1,28 +1,49 @@
+from abc import ABC
+
 from ipywidgets import Widget, widget_serialization
-from traitlets import Bool, Enum, HasTraits, Instance, Int, Unicode, Union
+from traitlets import Bool, Enum, HasTraits, Instance, Int, Unicode
 
 from ._frontend import module_name, module_version
 
+_audio_graph = None
+
+
+def _get_audio_graph():
+    """Returns the audio graph of ipytone's main audio context.
+
+    The graph module is imported on first call (circular import).
+
+    """
+    global _audio_graph
+
+    if _audio_graph is None:
+        from .graph import get_audio_graph
+
+        _audio_graph = get_audio_graph()
+
+    return _audio_graph
+
 
 class ToneWidgetBase(Widget):
     _model_module = Unicode(module_name).tag(sync=True)
     _model_module_version = Unicode(module_version).tag(sync=True)
 
+    _is_native = False
+
 
 class NativeAudioNode(ToneWidgetBase):
     """A widget that wraps a Web API Audio native AudioNode object."""
 
     _model_name = Unicode("NativeAudioNodeModel").tag(sync=True)
 
+    _is_native = True
     _is_param = False
     _n_inputs = Int(1, allow_none=True).tag(sync=True)
     _n_outputs = Int(1, allow_none=True).tag(sync=True)
     type = Unicode().tag(sync=True)
 
     def __init__(self, *args, **kwargs):
-        from .graph import _AUDIO_GRAPH
-
-        self._graph = _AUDIO_GRAPH
+        self._graph = _get_audio_graph()
 
         super().__init__(*args, **kwargs)
 
@@ -47,8 +68,7 @@ class NativeAudioNode(ToneWidgetBase):
         return self
 
     def _repr_keys(self):
-        if self.type:
-            yield "type"
+        return ("type",) if self.type else ()
 
 
 class NativeAudioParam(ToneWidgetBase):
@@ -56,16 +76,16 @@ class NativeAudioParam(ToneWidgetBase):
 
     _model_name = Unicode("NativeAudioParamModel").tag(sync=True)
 
+    _is_native = True
     _is_param = True
     type = Unicode().tag(sync=True)
 
     def _repr_keys(self):
-        if self.type:
-            yield "type"
+        return ("type",) if self.type else ()
 
 
 def is_native(widget):
-    return isinstance(widget, (NativeAudioNode, NativeAudioParam))
+    return getattr(widget, "_is_native", False)
 
 
 class ToneObject(ToneWidgetBase):
@@ -73,9 +93,7 @@ class ToneObject(ToneWidgetBase):
     _disposed = Bool(False).tag(sync=True)
 
     def __init__(self, *args, **kwargs):
-        from .graph import _AUDIO_GRAPH
-
-        self._graph = _AUDIO_GRAPH
+        self._graph = _get_audio_graph()
 
         super().__init__(*args, **kwargs)
 
@@ -100,24 +118,49 @@ class ToneObject(ToneWidgetBase):
         super().close()
 
     def _repr_keys(self):
-        if self.disposed:
-            yield "disposed"
+        return ("disposed",) if self.disposed else ()
 
 
 def is_disposed(node):
     return not is_native(node) and node.disposed
 
 
-class NodeWithContext(ToneObject):
-    name = Unicode("").tag(sync=True)
+def _merge_extra_repr_keys(cls):
+    """Merge the ``_extra_repr_keys`` declared in a class and all its base
+    classes (base class keys first, without duplicates).
 
-    _model_name = Unicode("NodeWithContextModel").tag(sync=True)
+    """
+    keys = {}
+    for klass in reversed(cls.__mro__):
+        keys.update(dict.fromkeys(klass.__dict__.get("_extra_repr_keys", ())))
+    return tuple(keys)
+
+
+class _ReprKeysMixin:
+    """Repr keys shared by named nodes (name, disposed and extra keys)."""
+
+    # trait or property names always shown in repr (after name and disposed),
+    # merged with those declared in base classes at subclass creation
+    _extra_repr_keys = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._extra_repr_keys = _merge_extra_repr_keys(cls)
 
     def _repr_keys(self):
+        keys = []
         if self.name:
-            yield "name"
+            keys.append("name")
         if self.disposed:
-            yield "disposed"
+            keys.append("disposed")
+        keys.extend(self._extra_repr_keys)
+        return keys
+
+
+class NodeWithContext(_ReprKeysMixin, ToneObject):
+    name = Unicode("").tag(sync=True)
+
+    _model_name = Unicode("NodeWithContextModel").tag(sync=True)
 
 
 class AudioNode(NodeWithContext):
@@ -202,11 +245,12 @@ class AudioNode(NodeWithContext):
     def chain(self, *nodes):
         """Connect the output of this audio node to the other audio nodes in series."""
 
-        chain_nodes = [self] + list(nodes)
+        src = self
 
         with self._graph.hold_state():
-            for i in range(len(chain_nodes) - 1):
-                self._graph.connect(chain_nodes[i], chain_nodes[i + 1])
+            for dest in nodes:
+                self._graph.connect(src, dest)
+                src = dest
 
         return self
 
@@ -254,7 +298,32 @@ class PyInternalAudioNode(AudioNode):
     _model_name = Unicode("PyInternalAudioNodeModel").tag(sync=True)
 
 
-class PyAudioNode(HasTraits):
+class AudioNodeLike(ABC):
+    """Virtual base class of all ipytone widgets and :class:`PyAudioNode` objects.
+
+    Used to validate the input / output nodes of a :class:`PyAudioNode` with a
+    single ``isinstance`` check.
+
+    """
+
+
+AudioNodeLike.register(ToneWidgetBase)
+
+
+def _get_node_widget(node, attr, max_depth=50):
+    """Walk through (possibly nested) pure-Python audio nodes until
+    reaching an input or output audio node widget (or None).
+
+    """
+    for _ in range(max_depth):
+        if not isinstance(node, PyAudioNode):
+            return node
+        node = getattr(node, attr)
+
+    raise RuntimeError(f"could not find {attr} audio node widget")
+
+
+class PyAudioNode(_ReprKeysMixin, HasTraits):
     """A Pure-Python audio node.
 
     Although it provides the same interface than :class:`AudioNode`, it is not a
@@ -270,18 +339,8 @@ class PyAudioNode(HasTraits):
 
     name = Unicode("").tag(sync=True)
 
-    _input = Union(
-        (
-            Instance(ToneWidgetBase, allow_none=True),
-            Instance("ipytone.PyAudioNode", allow_none=True),
-        )
-    )
-    _output = Union(
-        (
-            Instance(ToneWidgetBase, allow_none=True),
-            Instance("ipytone.PyAudioNode", allow_none=True),
-        )
-    )
+    _input = Instance(AudioNodeLike, allow_none=True)
+    _output = Instance(AudioNodeLike, allow_none=True)
 
     _set_node_channels = Bool(True)
     channel_count = Int(2)
@@ -289,8 +348,6 @@ class PyAudioNode(HasTraits):
     channel_interpretation = Enum(["speakers", "discrete"], default_value="speakers")
 
     def __init__(self, input_node, output_node, **kwargs):
-        from .graph import _AUDIO_GRAPH
-
         # ignore _input / _output kwargs -> must be passed as args
         kwargs.pop("_input", None)
         kwargs.pop("_output", None)
@@ -300,20 +357,10 @@ class PyAudioNode(HasTraits):
         self._output = output_node
 
         # the internal node must have two widgets (or None) as input/output
-        max_iter = 50
-        err_msg = "could not find input/output audio node widget"
-        i = 0
-        while isinstance(input_node, PyAudioNode):
-            input_node = input_node.input
-            if i >= max_iter:
-                raise StopIteration(err_msg)
-        i = 0
-        while isinstance(output_node, PyAudioNode):
-            output_node = output_node.output
-            if i >= max_iter:
-                raise StopIteration(err_msg)
-
-        self._graph = _AUDIO_GRAPH
+        input_node = _get_node_widget(input_node, "input")
+        output_node = _get_node_widget(output_node, "output")
+
+        self._graph = _get_audio_graph()
 
         self._node = PyInternalAudioNode(_input=input_node, _output=output_node, **kwargs)
 
@@ -369,17 +416,13 @@ class PyAudioNode(HasTraits):
     def close(self):
         self._node.close()
 
-    def _repr_keys(self):
-        if self.name:
-            yield "name"
-        if self.disposed:
-            yield "disposed"
-
     def _gen_repr_from_keys(self, keys):
-        class_name = self.__class__.__name__
-        signature = ", ".join(f"{key}={getattr(self, key)!r}" for key in keys)
-        return f"{class_name}({signature})"
+        signature = ", ".join([f"{key}={getattr(self, key)!r}" for key in keys])
+        return f"{type(self).__name__}({signature})"
 
     def __repr__(self):
         # emulate repr of ipywidgets.Widget (no DOM)
         return self._gen_repr_from_keys(self._repr_keys())
+
+
+AudioNodeLike.register(PyAudioNode)
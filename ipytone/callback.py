@@ -4,21 +4,24 @@ class BaseCallbackArg:
 
     """
 
-    def __init__(self, caller, value=None):
+    __slots__ = ("caller", "value", "_root", "_disposed", "_items")
+
+    def __init__(self, caller, value=None, _root=None):
         self.caller = caller
         self.value = value
-        self._parent = None
+        # derived placeholders reference the root one (None for the root
+        # itself), which is the only one holding the items
+        self._root = _root
         self._disposed = False
-        self._items = []
+        self._items = [] if _root is None else None
 
     def derive(self, value):
         """Return a new, derived placeholder, which may holds a different value
         but still references items from the current placeholder.
 
         """
-        new_obj = type(self)(self.caller, value=value)
+        new_obj = type(self)(self.caller, value=value, _root=self._root or self)
         new_obj._disposed = self._disposed
-        new_obj._parent = self
         return new_obj
 
     @property
@@ -37,14 +40,7 @@ class BaseCallbackArg:
                 f"Callback argument placeholder {self!r} is used outside of its context."
             )
 
-        items = self._items
-
-        parent = self._parent
-        while parent is not None:
-            items = parent._items
-            parent = parent._parent
-
-        return items
+        return (self._root or self)._items
 
     def __repr__(self):
         return f"{type(self).__name__}(value={self.value!r})"
@@ -59,6 +55,8 @@ class TimeCallbackArg(BaseCallbackArg):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, value="time", **kwargs):
         super().__init__(*args, value=value, **kwargs)
 
@@ -87,6 +85,8 @@ class EventValueCallbackArg(BaseCallbackArg):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, value="value", **kwargs):
         super().__init__(*args, value=value, **kwargs)
 
@@ -124,7 +124,9 @@ def add_or_send_event(method, callee, args, event="trigger"):
       for easy access to that widget).
 
     - Otherwise, the message data is sent directly to the front-end by the
-      ``callee`` widget.
+      ``callee`` widget, unless the ``callee`` currently holds its events (see,
+      e.g., :meth:`ipytone.Param.hold_events`). In the latter case the message
+      data is appended to the list of held events.
 
     """
     decoded_args = {}
@@ -136,7 +138,7 @@ def add_or_send_event(method, callee, args, event="trigger"):
         else:
             decoded_args[name] = {"value": arg, "eval": False}
 
-    data = {"method": method, "args": decoded_args, "arg_keys": list(args.keys())}
+    data = {"method": method, "args": decoded_args, "arg_keys": list(decoded_args)}
 
     if len(callback_args):
         data["callee"] = callee.model_id
@@ -144,7 +146,11 @@ def add_or_send_event(method, callee, args, event="trigger"):
             ca.items.append(data)
     else:
         data["event"] = event
-        callee.send(data)
+        held_events = getattr(callee, "_held_events", None)
+        if held_events is not None:
+            held_events.append(data)
+        else:
+            callee.send(data)
 
 
 def collect_and_merge_items(*clb_args):
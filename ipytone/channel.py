@@ -1,3 +1,5 @@
+import weakref
+
 from ipywidgets import widget_serialization
 from traitlets import Bool, Enum, Float, Instance, Int, Unicode
 
@@ -62,6 +64,8 @@ class Panner(AudioNode):
 
     _pan = Instance(Param).tag(sync=True, **widget_serialization)
 
+    _extra_repr_keys = ("pan",)
+
     def __init__(self, pan=0, channel_count=1, **kwargs):
         panner_node = NativeAudioNode(type="StereoPannerNode")
         pan_node = Param(value=pan, units="audioRange", _create_node=False)
@@ -79,10 +83,6 @@ class Panner(AudioNode):
         """
         return self._pan
 
-    def _repr_keys(self):
-        yield from super()._repr_keys()
-        yield "pan"
-
     def dispose(self):
         with self._graph.hold_state():
             super().dispose()
@@ -296,8 +296,9 @@ class Channel(PyAudioNode):
 
     """
 
-    # all channel buses that may be accessed by their name
-    _buses = {}
+    # all channel buses that may be accessed by their name (shared by all
+    # channels, closed bus nodes are dropped)
+    _buses = weakref.WeakValueDictionary()
 
     def __init__(self, pan=0, volume=0, solo=False, mute=False, channel_count=1, **kwargs):
         self._solo = Solo(solo=solo)
@@ -343,9 +344,10 @@ class Channel(PyAudioNode):
     def _get_bus(self, name) -> Gain:
         """Get access to the bus channel referenced by ``name`` via a Gain
         node (create the node if it doesn't exists yet)."""
-        if name not in self._buses:
-            self._buses[name] = Gain()
-        return self._buses[name]
+        bus = self._buses.get(name)
+        if bus is None or bus.disposed:
+            bus = self._buses[name] = Gain()
+        return bus
 
     def send(self, name, volume=0) -> Gain:
         """Send audio from this channel (post-fader) to the channel bus.
@@ -365,8 +367,9 @@ class Channel(PyAudioNode):
         """
         bus_gain = self._get_bus(name)
         send_gain = Gain(gain=volume, units="decibels")
-        self.connect(send_gain)
-        send_gain.connect(bus_gain)
+        with self._graph.hold_state():
+            self.connect(send_gain)
+            send_gain.connect(bus_gain)
         return send_gain
 
     def receive(self, name):
@@ -386,6 +389,8 @@ class Merge(AudioNode):
 
     _channels = Int(2).tag(sync=True)
 
+    _extra_repr_keys = ("channels",)
+
     def __init__(self, channels=2, **kwargs):
         merger = NativeAudioNode(type="ChannelMergerNode")
         super().__init__(
@@ -396,10 +401,6 @@ class Merge(AudioNode):
     def channels(self):
         return self._channels
 
-    def _repr_keys(self):
-        yield from super()._repr_keys()
-        yield "channels"
-
 
 class Split(AudioNode):
     """An audio node that splits an incoming signal into the number of given channels."""
@@ -408,6 +409,8 @@ class Split(AudioNode):
 
     _channels = Int(2).tag(sync=True)
 
+    _extra_repr_keys = ("channels",)
+
     def __init__(self, channels=2, **kwargs):
         splitter = NativeAudioNode(type="ChannelSplitterNode")
         super().__init__(
@@ -422,10 +425,6 @@ class Split(AudioNode):
     def channels(self):
         return self._channels
 
-    def _repr_keys(self):
-        yield from super()._repr_keys()
-        yield "channels"
-
 
 class MultibandSplit(PyAudioNode):
     """Split the incoming signal into three bands (low, mid, high), with
@@ -433,6 +432,8 @@ class MultibandSplit(PyAudioNode):
 
     """
 
+    _extra_repr_keys = ("low_frequency", "high_frequency", "q")
+
     def __init__(self, low_frequency=400, high_frequency=2500, q=1, **kwargs):
         in_gain = Gain()
 
@@ -487,12 +488,6 @@ class MultibandSplit(PyAudioNode):
         """Filter Q factor."""
         return self._q
 
-    def _repr_keys(self):
-        for key in super()._repr_keys():
-            yield key
-        for key in ["low_frequency", "high_frequency", "q"]:
-            yield key
-
     def dispose(self):
         with self._graph.hold_state():
             super().dispose()
@@ -515,7 +510,9 @@ class Mono(PyAudioNode):
     def __init__(self, **kwargs):
         gain = Gain()
         merge = Merge()
-        gain.connect(merge, 0, 0)
-        gain.connect(merge, 0, 1)
         kwargs.update({"_set_node_channels": False})
         super().__init__(gain, merge, **kwargs)
+
+        with self._graph.hold_state():
+            gain.connect(merge, 0, 0)
+            gain.connect(merge, 0, 1)
@@ -1,4 +1,5 @@
 import math
+from contextlib import contextmanager
 
 import numpy as np
 from ipywidgets import Widget, widget_serialization
@@ -35,6 +36,14 @@ UNITS = [
     "transportTime",
 ]
 
+# default param value limits for specific units (other units: 0 / inf)
+# min value for "number" and "decibels" units is the one of web audio API GainNode
+_UNITS_MIN_VALUE = {"audioRange": -1, "number": -math.inf, "decibels": -math.inf}
+_UNITS_MAX_VALUE = {"audioRange": 1, "normalRange": 1}
+
+# units for which ramp_to selects an exponential ramp
+_EXP_RAMP_UNITS = frozenset({"frequency", "bpm", "decibels"})
+
 
 class InternalAudioNode(AudioNode):
     """Widget that wraps a Tone.js audio node instance with no exposed functionality.
@@ -61,11 +70,39 @@ class InternalAudioNode(AudioNode):
         return self._n_outputs
 
     def _repr_keys(self):
-        if self.type:
-            yield "type"
+        return ("type",) if self.type else ()
 
 
 class ParamScheduleMixin:
+    _held_events = None
+
+    @contextmanager
+    def hold_events(self):
+        """Hold sending the automation events scheduled directly (i.e., not
+        within an ipytone scheduled callback) until the outermost context
+        manager exits, then send them all at once to the front-end.
+
+        Examples
+        --------
+
+        >>> osc = ipytone.Oscillator().to_destination()
+        >>> with osc.frequency.hold_events():
+        ...     for i, freq in enumerate([440, 220, 330, 550]):
+        ...         osc.frequency.linear_ramp_to_value_at_time(freq, f"+{i}")
+
+        """
+        if self._held_events is not None:
+            yield
+        else:
+            self._held_events = []
+            try:
+                yield
+            finally:
+                items = self._held_events
+                self._held_events = None
+                if items:
+                    self.send({"event": "batch", "items": items})
+
     def set_value_at_time(self, value, time):
         """Schedules a parameter value change at the given time."""
         add_or_send_event("setValueAtTime", self, {"value": value, "time": time})
@@ -146,7 +183,7 @@ class ParamScheduleMixin:
         depending on the `units` of the signal
 
         """
-        if self.units in ["frequency", "bpm", "decibels"]:
+        if self.units in _EXP_RAMP_UNITS:
             return self.exp_ramp_to(value, ramp_time, start_time)
         else:
             return self.linear_ramp_to(value, ramp_time, start_time)
@@ -182,11 +219,18 @@ class ParamScheduleMixin:
         Optionally scale values with a ``scaling`` factor.
 
         """
+        if isinstance(values, np.ndarray):
+            # convert to Python numbers in one pass (numpy scalars like
+            # np.int64 are not JSON serializable)
+            values = values.tolist()
+        else:
+            values = list(values)
+
         add_or_send_event(
             "setValueCurveAtTime",
             self,
             {
-                "values": list(values),
+                "values": values,
                 "start_time": start_time,
                 "duration": duration,
                 "scaling": scaling,
@@ -221,7 +265,8 @@ class Param(NodeWithContext, ParamScheduleMixin, ScheduleObserveMixin):
     _input = Union((Instance(NativeAudioParam), Instance(NativeAudioNode))).tag(
         sync=True, **widget_serialization
     )
-    _units = Enum(UNITS, default_value="number", allow_none=False).tag(sync=True)
+    # dict keys: constant-time validation while preserving order in error messages
+    _units = Enum(dict.fromkeys(UNITS), default_value="number", allow_none=False).tag(sync=True)
     value = Union((Float(), Int(), Unicode()), help="Parameter value").tag(sync=True)
     _min_value = Union((Float(), Int()), default_value=None, allow_none=True).tag(sync=True)
     _max_value = Union((Float(), Int()), default_value=None, allow_none=True).tag(sync=True)
@@ -271,24 +316,14 @@ class Param(NodeWithContext, ParamScheduleMixin, ScheduleObserveMixin):
         """Parameter value lower limit."""
         if self._min_value is not None:
             return self._min_value
-        elif self._units == "audioRange":
-            return -1
-        elif self._units in ["number", "decibels"]:
-            # min value for web audio API GainNode
-            return -math.inf
-        else:
-            # all other units
-            return 0
+        return _UNITS_MIN_VALUE.get(self._units, 0)
 
     @property
     def max_value(self):
         """Parameter value upper limit."""
         if self._max_value is not None:
             return self._max_value
-        elif self._units in ["audioRange", "normalRange"]:
-            return 1
-        else:
-            return math.inf
+        return _UNITS_MAX_VALUE.get(self._units, math.inf)
 
     @property
     def input(self):
@@ -296,12 +331,12 @@ class Param(NodeWithContext, ParamScheduleMixin, ScheduleObserveMixin):
         return self._input
 
     def _repr_keys(self):
-        yield from super()._repr_keys()
+        keys = list(super()._repr_keys())
         if self.overridden:
-            yield "overridden"
+            keys.append("overridden")
         else:
-            yield "value"
-            yield "units"
+            keys += ("value", "units")
+        return keys
 
 
 class Gain(AudioNode):
@@ -311,6 +346,8 @@ class Gain(AudioNode):
 
     _gain = Instance(Param).tag(sync=True, **widget_serialization)
 
+    _extra_repr_keys = ("gain",)
+
     def __init__(self, gain=1, units="gain", **kwargs):
         name = kwargs.pop("name", "")
         create_node = kwargs.pop("_create_node", True)
@@ -327,10 +364,6 @@ class Gain(AudioNode):
         """The gain parameter."""
         return self._gain
 
-    def _repr_keys(self):
-        yield from super()._repr_keys()
-        yield "gain"
-
     def dispose(self):
         with self._graph.hold_state():
             super().dispose()
@@ -347,6 +380,8 @@ class Volume(AudioNode):
     _volume = Instance(Param).tag(sync=True, **widget_serialization)
     mute = Bool(False).tag(sync=True)
 
+    _extra_repr_keys = ("volume", "mute")
+
     def __init__(self, volume=0, mute=False, **kwargs):
         node = Gain(gain=volume, units="decibels", _create_node=False)
         _volume = node._gain
@@ -358,11 +393,6 @@ class Volume(AudioNode):
         """The volume parameter."""
         return self._volume
 
-    def _repr_keys(self):
-        yield from super()._repr_keys()
-        yield "volume"
-        yield "mute"
-
 
 class Destination(AudioNode):
     """Main output node (speakers) of an audio context.
@@ -374,6 +404,7 @@ class Destination(AudioNode):
     """
 
     _singleton = None
+    _initialized = False
 
     _model_name = Unicode("DestinationModel").tag(sync=True)
 
@@ -382,28 +413,30 @@ class Destination(AudioNode):
     _volume = Instance(Param).tag(sync=True, **widget_serialization)
     mute = Bool(False).tag(sync=True)
 
+    _extra_repr_keys = ("volume", "mute")
+
     def __new__(cls):
         if Destination._singleton is None:
             Destination._singleton = super().__new__(cls)
         return Destination._singleton
 
     def __init__(self, **kwargs):
+        # singleton: don't re-create the internal nodes on subsequent calls
+        if self._initialized:
+            return
+
         in_node = Volume(_create_node=False)
         out_node = Gain(_create_node=False)
 
         kwargs.update({"_input": in_node, "_output": out_node, "_volume": in_node.volume})
         super().__init__(**kwargs)
+        self._initialized = True
 
     @property
     def volume(self) -> Param:
         """The volume parameter."""
         return self._volume
 
-    def _repr_keys(self):
-        yield from super()._repr_keys()
-        yield "volume"
-        yield "mute"
-
 
 def get_destination():
     """Returns the :py:class:`~core.Destination` instance created for the main
@@ -413,8 +446,12 @@ def get_destination():
     return Destination()
 
 
-# TODO: remove (deprecated)
-destination = get_destination()
+def __getattr__(name):
+    # TODO: remove (deprecated)
+    # the destination widget is only created on first access
+    if name == "destination":
+        return get_destination()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class AudioBuffer(ToneObject):
@@ -468,18 +505,19 @@ class AudioBuffer(ToneObject):
         super().__init__(**kwargs)
 
     def _repr_keys(self):
-        yield from super()._repr_keys()
+        keys = list(super()._repr_keys())
         if not self.disposed:
-            yield "loaded"
+            keys.append("loaded")
             if self.loaded:
-                yield "duration"
+                keys.append("duration")
+        return keys
 
 
 def add_buf_to_collection(buffers, key, url, base_url="", create_node=False):
-    if isinstance(url, str):
-        buf = AudioBuffer(base_url + url, _create_node=create_node)
-    elif isinstance(url, AudioBuffer):
+    if isinstance(url, AudioBuffer):
         buf = url
+    elif isinstance(url, str):
+        buf = AudioBuffer(base_url + url, _create_node=create_node)
     else:
         raise TypeError("Invalid buffer: must be a string (url) or AudioBuffer")
 
@@ -562,9 +600,10 @@ class AudioBuffers(ToneObject):
         return self
 
     def _repr_keys(self):
-        yield from super()._repr_keys()
+        keys = list(super()._repr_keys())
         if not self.disposed:
-            yield "loaded"
+            keys.append("loaded")
+        return keys
 
 
 class Listener(AudioNode):
@@ -597,6 +636,7 @@ class Listener(AudioNode):
     """
 
     _singleton = None
+    _initialized = False
 
     _model_name = Unicode("ListenerModel").tag(sync=True)
 
@@ -618,6 +658,10 @@ class Listener(AudioNode):
         return Listener._singleton
 
     def __init__(self):
+        # singleton: don't re-create the internal params on subsequent calls
+        if self._initialized:
+            return
+
         params = {
             "_position_x": Param(value=0, _create_node=False),
             "_position_y": Param(value=0, _create_node=False),
@@ -631,6 +675,7 @@ class Listener(AudioNode):
         }
 
         super().__init__(_set_node_channels=False, **params)
+        self._initialized = True
 
     @property
     def position_x(self) -> Param:
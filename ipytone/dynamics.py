@@ -18,6 +18,8 @@ class Compressor(AudioNode):
     _release = Instance(Param).tag(sync=True, **widget_serialization)
     _knee = Instance(Param).tag(sync=True, **widget_serialization)
 
+    _extra_repr_keys = ("threshold", "ratio")
+
     def __init__(self, threshold=-24, ratio=12, attack=0.003, release=0.25, knee=30, **kwargs):
         _compressor = NativeAudioNode(type="DynamicsCompressorNode")
 
@@ -71,12 +73,6 @@ class Compressor(AudioNode):
         """Knee parameter."""
         return self._knee
 
-    def _repr_keys(self):
-        for key in super()._repr_keys():
-            yield key
-        for key in ["threshold", "ratio"]:
-            yield key
-
     def dispose(self):
         with self._graph.hold_state():
             super().dispose()
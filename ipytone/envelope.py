@@ -38,6 +38,8 @@ class Envelope(AudioNode, ScheduleObserveMixin):
 
     _observable_traits = List(["value"])
 
+    _extra_repr_keys = ("attack", "decay", "sustain", "release")
+
     def __init__(self, **kwargs):
         if "_output" not in kwargs:
             out_node = Signal(units="normalRange", _create_node=False)
@@ -91,12 +93,6 @@ class Envelope(AudioNode, ScheduleObserveMixin):
         add_or_send_event("triggerAttackRelease", self, args)
         return self
 
-    def _repr_keys(self):
-        for key in super()._repr_keys():
-            yield key
-        for key in ["attack", "decay", "sustain", "release"]:
-            yield key
-
 
 class AmplitudeEnvelope(Envelope):
     """Envelope which, applied to an input audio signal, control the gain
@@ -41,6 +41,8 @@ class BiquadFilter(AudioNode):
     array_length = Int(128, help="Curve data resolution (array length)").tag(sync=True)
     sync_array = Bool(False, help="If True, synchronize curve data").tag(sync=True)
 
+    _extra_repr_keys = ("type", "frequency", "q")
+
     def __init__(self, type="lowpass", frequency=350, q=1, detune=0, gain=0, **kwargs):
         bq_filter = NativeAudioNode(type="BiquadFilterNode")
 
@@ -86,12 +88,6 @@ class BiquadFilter(AudioNode):
         """
         return self._gain
 
-    def _repr_keys(self):
-        for key in super()._repr_keys():
-            yield key
-        for key in ["type", "frequency", "q"]:
-            yield key
-
     def dispose(self):
         with self._graph.hold_state():
             super().dispose()
@@ -130,6 +126,8 @@ class Filter(AudioNode):
     array_length = Int(128, help="Curve data resolution (array length)").tag(sync=True)
     sync_array = Bool(False, help="If True, synchronize curve data").tag(sync=True)
 
+    _extra_repr_keys = ("type", "frequency", "q")
+
     def __init__(self, type="lowpass", frequency=350, q=1, detune=0, gain=0, rolloff=-12, **kwargs):
         in_gain = Gain(_create_node=False)
         out_gain = Gain(_create_node=False)
@@ -177,12 +175,6 @@ class Filter(AudioNode):
         """
         return self._gain
 
-    def _repr_keys(self):
-        for key in super()._repr_keys():
-            yield key
-        for key in ["type", "frequency", "q"]:
-            yield key
-
     def dispose(self):
         with self._graph.hold_state():
             super().dispose()
@@ -213,6 +205,8 @@ class OnePoleFilter(AudioNode):
         sync=True
     )
 
+    _extra_repr_keys = ("type", "frequency")
+
     def __init__(self, **kwargs):
         in_gain = Gain(_create_node=False)
         out_gain = Gain(_create_node=False)
@@ -229,12 +223,6 @@ class OnePoleFilter(AudioNode):
     array_length = Int(128, help="Curve data resolution (array length)").tag(sync=True)
     sync_array = Bool(False, help="If True, synchronize curve data").tag(sync=True)
 
-    def _repr_keys(self):
-        for key in super()._repr_keys():
-            yield key
-        for key in ["type", "frequency"]:
-            yield key
-
 
 class FeedbackCombFilter(AudioNode):
     """Feedback comb filter."""
@@ -244,6 +232,8 @@ class FeedbackCombFilter(AudioNode):
     _delay_time = Instance(Param).tag(sync=True, **widget_serialization)
     _resonance = Instance(Param).tag(sync=True, **widget_serialization)
 
+    _extra_repr_keys = ("delay_time", "resonance")
+
     def __init__(self, delay_time=0.1, resonance=0.5, **kwargs):
         in_gain = Gain(_create_node=False)
         out_gain = Gain(_create_node=False)
@@ -271,12 +261,6 @@ class FeedbackCombFilter(AudioNode):
         """Amount of feedback of the delayed signal."""
         return self._resonance
 
-    def _repr_keys(self):
-        for key in super()._repr_keys():
-            yield key
-        for key in ["delay_time", "resonance"]:
-            yield key
-
     def dispose(self):
         with self._graph.hold_state():
             super().dispose()
@@ -288,6 +272,8 @@ class FeedbackCombFilter(AudioNode):
 class LowpassCombFilter(PyAudioNode):
     """Feedback comb + lowpass filter."""
 
+    _extra_repr_keys = ("delay_time", "resonance", "dampening")
+
     def __init__(self, delay_time=0.1, resonance=0.5, dampening=3000, **kwargs):
         self._fc_filter = FeedbackCombFilter(delay_time=delay_time, resonance=resonance)
         self._lowpass_filter = OnePoleFilter(type="lowpass", frequency=dampening)
@@ -313,12 +299,6 @@ class LowpassCombFilter(PyAudioNode):
     def dampening(self, value):
         self._lowpass_filter.frequency = value
 
-    def _repr_keys(self):
-        for key in super()._repr_keys():
-            yield key
-        for key in ["delay_time", "resonance", "dampening"]:
-            yield key
-
 
 # class PhaseShiftAllpass(AudioNode):
 #     """Optimized implementation of Hilbert transform using two all-pass IIR
@@ -1,7 +1,7 @@
 from contextlib import contextmanager
 
 from ipywidgets import widget_serialization
-from traitlets import Instance, Int, List, Tuple, Unicode, Union
+from traitlets import Instance, Int, List, Tuple, Unicode, Union, observe
 
 from .base import (
     AudioNode,
@@ -30,6 +30,10 @@ _Connection = List(
 )
 
 
+_SRC_NODE_TYPES = (AudioNode, NativeAudioNode)
+_DEST_NODE_TYPES = (AudioNode, NativeAudioNode, Param, NativeAudioParam)
+
+
 def _get_internal_nodes(src_node, dest_node):
     """Maybe return internal (widget) nodes of pure-python source and
     destination nodes
@@ -50,11 +54,14 @@ class AudioGraph(ToneWidgetBase):
     _model_name = Unicode("AudioGraphModel").tag(sync=True)
     _connections = _Connection.tag(sync=True, **widget_serialization)
     _holding_state = False
+    _has_updates = False
+    _nodes = None
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        self._updated_connections = self._connections.copy()
+        # connections not yet synced, stored as an (insertion-ordered) set
+        self._updated_connections = dict.fromkeys(self._connections)
 
     @contextmanager
     def hold_state(self):
@@ -76,9 +83,9 @@ class AudioGraph(ToneWidgetBase):
 
         src_node, dest_node = _get_internal_nodes(src_node, dest_node)
 
-        if not isinstance(src_node, (AudioNode, NativeAudioNode)):
+        if not isinstance(src_node, _SRC_NODE_TYPES):
             raise ValueError("src_node must be a (native) AudioNode object")
-        if not isinstance(dest_node, (AudioNode, NativeAudioNode, Param, NativeAudioParam)):
+        if not isinstance(dest_node, _DEST_NODE_TYPES):
             raise ValueError("dest_node must be a (native) AudioNode or Param object")
         if isinstance(dest_node, AudioNode):
             if not dest_node.number_of_inputs:
@@ -87,9 +94,9 @@ class AudioGraph(ToneWidgetBase):
             raise ValueError(f"Cannot connect from audio sink {src_node}")
 
         conn = (src_node, dest_node, output_number, input_number)
-
-        if conn not in self._connections:
-            self._updated_connections.append(conn)
+        if conn not in self._updated_connections:
+            self._updated_connections[conn] = None
+            self._has_updates = True
 
         if not self._holding_state:
             self.sync_connections()
@@ -100,13 +107,14 @@ class AudioGraph(ToneWidgetBase):
         src_node, dest_node = _get_internal_nodes(src_node, dest_node)
         conn = (src_node, dest_node, output_number, input_number)
 
-        if conn not in self._connections:
+        if conn not in self._updated_connections:
             raise ValueError(
                 f"Node {src_node} (channel {output_number}) is not connected to "
                 f"node {dest_node} (channel {input_number})"
             )
 
-        self._updated_connections.remove(conn)
+        del self._updated_connections[conn]
+        self._has_updates = True
 
         if not self._holding_state:
             self.sync_connections()
@@ -116,7 +124,7 @@ class AudioGraph(ToneWidgetBase):
 
         self._holding_state = True
 
-        for src, dest, *channels in self._connections:
+        for src, dest, *channels in list(self._updated_connections):
             if is_disposed(src) or is_disposed(dest):
                 self.disconnect(src, dest, *channels)
 
@@ -126,8 +134,11 @@ class AudioGraph(ToneWidgetBase):
     def sync_connections(self):
         """Synchronize connections with the front-end (internal use)."""
 
-        self._connections = self._updated_connections
-        self._updated_connections = self._connections.copy()
+        # skip building and comparing the whole list of connections if
+        # nothing has changed since the last sync
+        if self._has_updates:
+            self._connections = list(self._updated_connections)
+            self._has_updates = False
 
     @property
     def connections(self):
@@ -137,18 +148,32 @@ class AudioGraph(ToneWidgetBase):
         """
         return list(self._connections)
 
+    @observe("_connections")
+    def _reset_nodes(self, change):
+        self._nodes = None
+
     @property
     def nodes(self):
         """Returns a list of all nodes in the audio graph."""
 
-        return list(
-            {node for conn in self._connections for node in conn if not isinstance(node, int)}
-        )
+        # cached until connections are synced again
+        if self._nodes is None:
+            self._nodes = tuple(
+                dict.fromkeys(
+                    node for conn in self._connections for node in conn if not isinstance(node, int)
+                )
+            )
+        return list(self._nodes)
 
 
-_AUDIO_GRAPH = AudioGraph()
+# created on first access
+_AUDIO_GRAPH = None
 
 
 def get_audio_graph():
     """Returns the audio graph of ipytone's main audio context."""
+    global _AUDIO_GRAPH
+
+    if _AUDIO_GRAPH is None:
+        _AUDIO_GRAPH = AudioGraph()
     return _AUDIO_GRAPH
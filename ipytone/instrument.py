@@ -439,8 +439,9 @@ class PluckSynth(Instrument):
 
         super().__init__(**kwargs)
 
-        self._noise.connect(self._lfcf)
-        self._lfcf.connect(self._output)
+        with self._graph.hold_state():
+            self._noise.connect(self._lfcf)
+            self._lfcf.connect(self._output)
 
     def _get_internal_nodes(self):
         return {
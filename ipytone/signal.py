@@ -13,13 +13,14 @@ class SignalOperator(AudioNode):
     _model_name = "SignalOperatorModel"
 
     def _create_op_signal(self, other, signal_cls, signal_attr_name):
-        if isinstance(other, SignalOperator):
-            op_signal = signal_cls()
-            other.connect(getattr(op_signal, signal_attr_name))
-        else:
-            op_signal = signal_cls(other)
+        with self._graph.hold_state():
+            if isinstance(other, SignalOperator):
+                op_signal = signal_cls()
+                other.connect(getattr(op_signal, signal_attr_name))
+            else:
+                op_signal = signal_cls(other)
 
-        self.connect(op_signal)
+            self.connect(op_signal)
 
         return op_signal
 
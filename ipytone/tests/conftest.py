@@ -63,7 +63,18 @@ def mock_comm():
 def audio_graph():
     audio_graph = get_audio_graph()
     audio_graph._connections = []
-    audio_graph._updated_connections = []
+    audio_graph._updated_connections = {}
+    audio_graph._has_updates = False
     yield audio_graph
     audio_graph._connections = []
-    audio_graph._updated_connections = []
+    audio_graph._updated_connections = {}
+    audio_graph._has_updates = False
+
+
+@pytest.fixture
+def graph_changes(audio_graph):
+    """Records the changes of the audio graph connections."""
+    changes = []
+    audio_graph.observe(changes.append, names="_connections")
+    yield changes
+    audio_graph.unobserve(changes.append, names="_connections")
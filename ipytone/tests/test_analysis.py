@@ -44,6 +44,11 @@ def test_meter():
     assert meter.output.channels == 1
     assert meter.output.size == 256
     assert meter.output.type == "waveform"
+    assert meter.output.smoothing == 0.8
+
+    meter = Meter(channel_count=2, smoothing=0.5)
+    assert meter.output.channels == 2
+    assert meter.output.smoothing == 0.5
 
 
 def test_dcmeter():
@@ -62,6 +67,9 @@ def test_waveform():
     with pytest.raises(ValueError, match="size must be a power of two"):
         waveform.size = 10
 
+    waveform = Waveform(size=256)
+    assert waveform.output.size == 256
+
 
 def test_fft():
     fft = FFT()
@@ -75,6 +83,14 @@ def test_fft():
         fft.size = 10
 
     assert fft.frequency_labels.size == fft.size
+    assert fft.frequency_labels is fft.frequency_labels
+    fft.size = 512
+    assert fft.frequency_labels.size == 512
+    assert fft.frequency_labels[-1] < 44100 / 2
+
+    fft = FFT(size=512, smoothing=0.5)
+    assert fft.output.size == 512
+    assert fft.output.smoothing == 0.5
 
 
 def test_follower(audio_graph):
@@ -91,4 +107,9 @@ def test_follower(audio_graph):
     assert follower.smoothing == 5
     assert follower.output.frequency == 1 / 5
 
+    # no-op when setting the current value (lowpass frequency not reset)
+    follower.output.frequency = 100
+    follower.smoothing = 5
+    assert follower.output.frequency == 100
+
     assert (follower.input, follower.output, 0, 0) in audio_graph.connections
@@ -1,3 +1,5 @@
+import pytest
+
 from ipytone.base import (
     AudioNode,
     NativeAudioNode,
@@ -5,6 +7,7 @@ from ipytone.base import (
     PyAudioNode,
     PyInternalAudioNode,
     ToneObject,
+    is_native,
 )
 from ipytone.core import InternalAudioNode, destination
 
@@ -16,6 +19,7 @@ def test_native_audio_node(audio_graph):
     assert node.number_of_outputs == 1
     assert node.type == "GainNode"
     assert repr(node) == "NativeAudioNode(type='GainNode')"
+    assert is_native(node)
 
     node2 = NativeAudioNode()
     node.connect(node2)
@@ -30,6 +34,7 @@ def test_native_audio_param():
 
     assert param.type == "Param"
     assert repr(param) == "NativeAudioParam(type='Param')"
+    assert is_native(param)
 
 
 def test_tone_object():
@@ -37,6 +42,8 @@ def test_tone_object():
 
     assert obj.disposed is False
     assert repr(obj) == "ToneObject()"
+    assert not is_native(obj)
+    assert not is_native(None)
     obj.dispose()
     assert obj.disposed is True
     assert repr(obj) == "ToneObject(disposed=True)"
@@ -60,6 +67,25 @@ def test_audio_node_creation():
     assert repr(node) == "AudioNode(name='test')"
 
 
+def test_audio_node_extra_repr_keys():
+    class NodeA(AudioNode):
+        _extra_repr_keys = ("channel_count",)
+
+    class NodeB(NodeA):
+        _extra_repr_keys = ("channel_count_mode", "channel_count")
+
+    assert NodeB._extra_repr_keys == ("channel_count", "channel_count_mode")
+    assert repr(NodeB()) == "NodeB(channel_count=2, channel_count_mode='max')"
+
+    class PyNode(PyAudioNode):
+        _extra_repr_keys = ("channel_count",)
+
+    class PyNodeB(PyNode):
+        pass
+
+    assert PyNodeB._extra_repr_keys == ("channel_count",)
+
+
 def test_audio_node_connect(audio_graph):
     node1 = InternalAudioNode()
     node2 = InternalAudioNode()
@@ -143,6 +169,15 @@ def test_audio_node_chain(audio_graph):
     assert n is node1
 
 
+@pytest.mark.parametrize("method", ["fan", "chain"])
+def test_audio_node_fan_chain_single_sync(audio_graph, graph_changes, method):
+    nodes = [InternalAudioNode() for _ in range(4)]
+    getattr(nodes[0], method)(*nodes[1:])
+
+    assert len(graph_changes) == 1
+    assert len(audio_graph.connections) == 3
+
+
 def test_pyaudionode(audio_graph):
     in_node_in = InternalAudioNode()
     in_node_out = InternalAudioNode()
@@ -165,6 +200,11 @@ def test_pyaudionode(audio_graph):
     assert node.widget.input is in_node_in
     assert node.widget.output is out_node
 
+    # cyclic nested nodes
+    in_node._input = in_node
+    with pytest.raises(RuntimeError, match="could not find input audio node widget"):
+        PyAudioNode(in_node, out_node)
+
     node2 = InternalAudioNode()
     n = node.connect(node2)
     assert (node.widget, node2, 0, 0) in audio_graph.connections
@@ -0,0 +1,15 @@
+from ipytone.callback import TimeCallbackArg
+
+
+def test_callback_arg_derive_items():
+    time = TimeCallbackArg(None)
+    derived = (time + 1) + 2
+
+    assert derived.value == "time + this.toSeconds(1) + this.toSeconds(2)"
+    assert derived.items is time.items
+    assert time._root is None
+    assert derived._root is time
+    assert derived._items is None
+
+    derived.items.append({"method": "foo"})
+    assert time.items == [{"method": "foo"}]
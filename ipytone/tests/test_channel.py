@@ -142,11 +142,14 @@ def test_channel():
     assert chan.muted is True
 
 
-def test_channel_buses(audio_graph):
+def test_channel_buses(audio_graph, graph_changes):
     chan1 = Channel()
     chan2 = Channel()
 
+    graph_changes.clear()
     sender = chan1.send("test", volume=-10)
+    assert len(graph_changes) == 1
+
     assert isinstance(sender, Gain)
     assert sender.gain.value == -10
     assert sender.gain.units == "decibels"
@@ -157,6 +160,18 @@ def test_channel_buses(audio_graph):
     assert (sender, Channel._buses["test"], 0, 0) in audio_graph.connections
     assert (Channel._buses["test"], chan2.widget, 0, 0) in audio_graph.connections
 
+    # disposed bus node is re-created
+    bus = Channel._buses["test"]
+    bus.dispose()
+    chan2.receive("test")
+    assert Channel._buses["test"] is not bus
+    assert (Channel._buses["test"], chan2.widget, 0, 0) in audio_graph.connections
+
+    # closed bus node is dropped (recorded graph changes hold references to it)
+    Channel._buses["test"].close()
+    graph_changes.clear()
+    assert "test" not in Channel._buses
+
 
 def test_merge():
     merge = Merge()
@@ -222,9 +237,12 @@ def test_multiband_split(audio_graph):
     assert msplit.q.disposed is True
 
 
-def test_mono(audio_graph):
+def test_mono(audio_graph, graph_changes):
     mono = Mono()
 
+    # both connections synced at once
+    assert len(graph_changes) == 1
+
     assert isinstance(mono.input, Gain)
     assert isinstance(mono.output, Merge)
 
@@ -16,6 +16,7 @@ from ipytone.core import (
     get_listener,
 )
 from ipytone.signal import Signal
+from ipytone.transport import get_transport
 
 
 def test_internal_audio_node():
@@ -85,6 +86,48 @@ def test_param_schedule_mixin(mocker, param_or_signal, method, js_method, args):
     param_or_signal.send.assert_called_once_with(expected)
 
 
+def test_param_set_value_curve_array(mocker, param_or_signal):
+    mocker.patch.object(param_or_signal, "send")
+
+    param_or_signal.set_value_curve_at_time(np.arange(3), 0, 2)
+
+    values = param_or_signal.send.call_args[0][0]["args"]["values"]["value"]
+    assert values == [0, 1, 2]
+    assert all(type(v) is int for v in values)
+
+
+def test_param_hold_events(mocker, param_or_signal):
+    mocker.patch.object(param_or_signal, "send")
+
+    with param_or_signal.hold_events():
+        param_or_signal.set_value_at_time(1, 0)
+        with param_or_signal.hold_events():
+            param_or_signal.linear_ramp_to_value_at_time(2, 1)
+        param_or_signal.send.assert_not_called()
+
+    expected_items = [
+        {
+            "event": "trigger",
+            "method": "setValueAtTime",
+            "args": {"value": {"value": 1, "eval": False}, "time": {"value": 0, "eval": False}},
+            "arg_keys": ["value", "time"],
+        },
+        {
+            "event": "trigger",
+            "method": "linearRampToValueAtTime",
+            "args": {"value": {"value": 2, "eval": False}, "time": {"value": 1, "eval": False}},
+            "arg_keys": ["value", "time"],
+        },
+    ]
+    param_or_signal.send.assert_called_once_with({"event": "batch", "items": expected_items})
+
+    # nothing held -> nothing sent
+    param_or_signal.send.reset_mock()
+    with param_or_signal.hold_events():
+        pass
+    param_or_signal.send.assert_not_called()
+
+
 def test_param():
     param = Param()
 
@@ -161,6 +204,9 @@ def test_destination():
     dest2 = Destination()
 
     assert dest1 == dest2 == destination
+    # internal nodes are not re-created
+    assert dest2.input is destination.input
+    assert dest2.volume is destination.volume
 
 
 def test_audio_buffer():
@@ -224,6 +270,10 @@ def test_listener():
     assert listener.up_y.value == 1
     assert listener.up_z.value == 0
 
+    # test singleton (params are not re-created)
+    assert get_listener() is listener
+    assert get_listener().position_x is listener.position_x
+
     listener.dispose()
     assert listener.position_x.disposed is True
     assert listener.position_y.disposed is True
@@ -234,3 +284,17 @@ def test_listener():
     assert listener.up_x.disposed is True
     assert listener.up_y.disposed is True
     assert listener.up_z.disposed is True
+
+
+def test_transport_singleton():
+    transport = get_transport()
+    event_id = transport._py_event_id
+    transport._get_event_id_and_inc(append=False)
+
+    try:
+        # bpm param is not re-created and the event id counter is not reset
+        assert get_transport() is transport
+        assert get_transport().bpm is transport.bpm
+        assert transport._py_event_id == event_id + 1
+    finally:
+        transport._py_event_id = event_id
@@ -20,13 +20,38 @@ def test_audio_graph(audio_graph, src, dest, param):
     audio_graph.connect(src, param, 0, 1)
     assert (src, param, 0, 1) in audio_graph.connections
 
-    assert audio_graph.nodes == list({src, dest, param})
+    assert audio_graph.nodes == [src, dest, param]
+    assert audio_graph.nodes is not audio_graph.nodes
     assert audio_graph.connections == [(src, dest, 0, 0), (src, param, 0, 1)]
 
     with audio_graph.hold_state():
         audio_graph.disconnect(src, dest)
         assert (src, dest, 0, 0) in audio_graph.connections
     assert (src, dest, 0, 0) not in audio_graph.connections
+    assert audio_graph.nodes == [src, param]
+
+    # connect / disconnect more than once before syncing
+    with audio_graph.hold_state():
+        audio_graph.connect(src, dest)
+        audio_graph.connect(src, dest)
+        audio_graph.disconnect(src, param, 0, 1)
+        with pytest.raises(ValueError, match=".*not connected to.*"):
+            audio_graph.disconnect(src, param, 0, 1)
+    assert audio_graph.connections == [(src, dest, 0, 0)]
+
+
+def test_audio_graph_sync_only_updates(audio_graph, graph_changes):
+    src = InternalAudioNode()
+    dest = InternalAudioNode()
+
+    audio_graph.connect(src, dest)
+    assert len(graph_changes) == 1
+
+    # no-op: connection already exists or nothing to clean
+    audio_graph.connect(src, dest)
+    audio_graph.clean()
+    assert audio_graph._has_updates is False
+    assert len(graph_changes) == 1
 
 
 def test_audi0_graph_py_audio_node(audio_graph):
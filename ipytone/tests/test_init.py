@@ -0,0 +1,25 @@
+import pytest
+
+import ipytone
+
+
+def test_lazy_attributes():
+    for name in ipytone.__all__:
+        assert getattr(ipytone, name) is not None
+
+    assert "PolySynth" in dir(ipytone)
+
+    with pytest.raises(AttributeError, match="has no attribute 'not_an_attribute'"):
+        ipytone.not_an_attribute
+
+
+def test_lazy_submodules():
+    names = ["analysis", "channel", "dynamics", "effect", "envelope"]
+    names += ["event", "filter", "instrument", "source", "utils"]
+
+    for name in names:
+        assert getattr(ipytone, name).__name__ == f"ipytone.{name}"
+
+    assert ipytone.channel.Panner is ipytone.Panner
+    assert "channel" in dir(ipytone)
+    assert "utils" in dir(ipytone)
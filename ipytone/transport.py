@@ -22,6 +22,7 @@ class Transport(ToneObject, ScheduleObserveMixin):
     """
 
     _singleton = None
+    _initialized = False
 
     _model_name = Unicode("TransportModel").tag(sync=True)
 
@@ -66,6 +67,10 @@ class Transport(ToneObject, ScheduleObserveMixin):
         return Transport._singleton
 
     def __init__(self, **kwargs):
+        # singleton: don't re-create the bpm param nor reset the events on subsequent calls
+        if self._initialized:
+            return
+
         bpm_param = Param(value=120, units="bpm", _create_node=False)
         kwargs.update({"_bpm": bpm_param})
 
@@ -74,6 +79,7 @@ class Transport(ToneObject, ScheduleObserveMixin):
         self._synced_signals = {}
 
         super().__init__(**kwargs)
+        self._initialized = True
 
     @property
     def bpm(self) -> Param:
@@ -175,6 +175,8 @@ export class ParamModel<T extends UnitName>
     if (command.event === 'trigger') {
       const argsArray = normalizeArguments(command.args, command.arg_keys);
       (this.node as any)[command.method](...argsArray);
+    } else if (command.event === 'batch') {
+      command.items.forEach((item: any) => this.handleMsg(item, _buffers));
     }
   }
 
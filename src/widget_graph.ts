@@ -74,11 +74,13 @@ export class AudioGraphModel extends ToneWidgetModel {
   }
 
   private updateConnections(): void {
+    // compute connection ids only once for each side of the diff
+    const prev_ids = new Set(getConnectionIds(this.connections_prev));
+    const current_ids = new Set(getConnectionIds(this.connections));
+
     // connect nodes for new connections
     const connAdded = this.connections.filter((other: Connection) => {
-      const other_id: string = getConnectionId(other);
-      const prev_ids = getConnectionIds(this.connections_prev);
-      return !prev_ids.includes(other_id);
+      return !prev_ids.has(getConnectionId(other));
     });
 
     getConnectionNodes(connAdded).forEach((conn_node) => {
@@ -87,9 +89,7 @@ export class AudioGraphModel extends ToneWidgetModel {
 
     // disconnect nodes for removed connections
     const connRemoved = this.connections_prev.filter((other: Connection) => {
-      const other_id: string = getConnectionId(other);
-      const current_ids = getConnectionIds(this.connections);
-      return !current_ids.includes(other_id);
+      return !current_ids.has(getConnectionId(other));
     });
 
     getConnectionNodes(connRemoved).forEach((conn_node) => {
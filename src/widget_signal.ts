@@ -88,6 +88,8 @@ export class SignalModel<T extends UnitName>
     if (command.event === 'trigger') {
       const argsArray = normalizeArguments(command.args, command.arg_keys);
       (this.node as any)[command.method](...argsArray);
+    } else if (command.event === 'batch') {
+      command.items.forEach((item: any) => this.handleMsg(item, _buffers));
     }
   }
 